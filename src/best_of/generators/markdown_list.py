@@ -15,6 +15,8 @@ from best_of.license import get_license
 
 log = logging.getLogger(__name__)
 
+md_link_invalid_chars = re.compile(r"[^a-zA-Z0-9-]")
+
 
 def generate_metrics_info(project: Dict, configuration: Dict) -> str:
     metrics_md = ""
@@ -36,17 +38,16 @@ def generate_metrics_info(project: Dict, configuration: Dict) -> str:
         metrics_md += " ⭐ " + str(utils.simplify_number(project.star_count))
 
     status_md = ""
+    now = datetime.now()
     project_total_month = None
     if project.created_at:
-        project_total_month = utils.diff_month(datetime.now(), project.created_at)
+        project_total_month = utils.diff_month(now, project.created_at)
 
     project_inactive_month = None
     if project.last_commit_pushed_at:
-        project_inactive_month = utils.diff_month(
-            datetime.now(), project.last_commit_pushed_at
-        )
+        project_inactive_month = utils.diff_month(now, project.last_commit_pushed_at)
     elif project.updated_at:
-        project_inactive_month = utils.diff_month(datetime.now(), project.updated_at)
+        project_inactive_month = utils.diff_month(now, project.updated_at)
 
     if (
         project_inactive_month
@@ -91,14 +92,17 @@ def generate_metrics_info(project: Dict, configuration: Dict) -> str:
     return metrics_md
 
 
-def get_label_info(label: str, labels: list) -> Dict:
+def get_labels_map(labels: list) -> dict:
     labels_map = {}
     for label_info in labels:
         label_info = Dict(label_info)
         if not label_info.label:
             continue
         labels_map[utils.simplify_str(label_info.label)] = label_info
+    return labels_map
 
+
+def lookup_label_info(label: str, labels_map: dict) -> Dict:
     label_query = utils.simplify_str(label)
     if label_query not in labels_map:
         return Dict({"name": label})
@@ -106,6 +110,10 @@ def get_label_info(label: str, labels: list) -> Dict:
     return labels_map[label_query]
 
 
+def get_label_info(label: str, labels: list) -> Dict:
+    return lookup_label_info(label, get_labels_map(labels))
+
+
 def generate_project_labels(project: Dict, labels: list) -> Tuple[str, int]:
     IMAGE_LABEL_LENGTH = 2
     LABEL_SPACING_LENGTH = 2
@@ -116,8 +124,10 @@ def generate_project_labels(project: Dict, labels: list) -> Tuple[str, int]:
     if not project.labels:
         return "", 0
 
+    # Build the lookup once instead of once per label
+    labels_map = get_labels_map(labels)
     for label in project.labels:
-        label_info = get_label_info(label, labels)
+        label_info = lookup_label_info(label, labels_map)
 
         if label_info.ignore:
             # Label should not be displayed
@@ -360,9 +370,11 @@ def generate_category_md(
         category_md += "_" + category.subtitle.strip() + "_\n\n"
 
     if category.projects:
-        for project in category.projects:
-            project_md = generate_project_md(project, config, labels)
-            category_md += project_md + "\n"
+        # Join once instead of concatenating per project
+        category_md += "".join(
+            generate_project_md(project, config, labels) + "\n"
+            for project in category.projects
+        )
 
     if category.hidden_projects:
         category_md += (
@@ -370,9 +382,10 @@ def generate_category_md(
             + str(len(category.hidden_projects))
             + " hidden projects...</summary>\n\n"
         )
-        for project in category.hidden_projects:
-            project_md = generate_project_md(project, config, labels)
-            category_md += project_md + "\n"
+        category_md += "".join(
+            generate_project_md(project, config, labels) + "\n"
+            for project in category.hidden_projects
+        )
         category_md += "</details>\n"
 
     return "<br>\n\n" + category_md
@@ -480,13 +493,13 @@ def generate_legend(configuration: Dict, labels: list, heading_level: int = 2) -
 
 def process_md_link(text: str) -> str:
     text = text.lower().replace(" ", "-")
-    return re.compile(r"[^a-zA-Z0-9-]").sub("", text)
+    return md_link_invalid_chars.sub("", text)
 
 
 def generate_toc(categories: OrderedDict, config: Dict) -> str:
     toc_md = "## Contents\n\n"
     for category in categories:
-        category_info = Dict(categories[category])
+        category_info = categories[category]
         if category_info.ignore:
             continue
 
@@ -520,9 +533,7 @@ def generate_toc(categories: OrderedDict, config: Dict) -> str:
     return toc_md + "\n"
 
 
-def generate_md(categories: OrderedDict, config: Dict, labels: list) -> str:
-    full_markdown = ""
-
+def count_projects(categories: OrderedDict, config: Dict) -> Tuple[int, int, int]:
     project_count = 0
     category_count = 0
     stars_count = 0
@@ -558,17 +569,24 @@ def generate_md(categories: OrderedDict, config: Dict, labels: list) -> str:
         # do not count others as category
         category_count -= 1
 
+    return project_count, category_count, stars_count
+
+
+def generate_md(categories: OrderedDict, config: Dict, labels: list) -> str:
+    full_markdown = ""
+
+    project_count, category_count, stars_count = count_projects(categories, config)
+    # Shared by the header and footer templates
+    counts = {
+        "project_count": utils.simplify_number(project_count),
+        "category_count": utils.simplify_number(category_count),
+        "stars_count": utils.simplify_number(stars_count),
+    }
+
     if config.markdown_header_file:
         if os.path.exists(config.markdown_header_file):
             with open(config.markdown_header_file, "r") as f:
-                full_markdown += (
-                    str(f.read()).format(
-                        project_count=utils.simplify_number(project_count),
-                        category_count=utils.simplify_number(category_count),
-                        stars_count=utils.simplify_number(stars_count),
-                    )
-                    + "\n"
-                )
+                full_markdown += str(f.read()).format(**counts) + "\n"
         else:
             log.warning(
                 "The markdown header file does not exist: "
@@ -581,18 +599,15 @@ def generate_md(categories: OrderedDict, config: Dict, labels: list) -> str:
     if config.generate_legend:
         full_markdown += generate_legend(config, labels)
 
-    for category in categories:
-        category_info = categories[category]
-        full_markdown += generate_category_md(category_info, config, labels)
+    full_markdown += "".join(
+        generate_category_md(categories[category], config, labels)
+        for category in categories
+    )
 
     if config.markdown_footer_file:
         if os.path.exists(config.markdown_footer_file):
             with open(config.markdown_footer_file, "r") as f:
-                full_markdown += str(f.read()).format(
-                    project_count=utils.simplify_number(project_count),
-                    category_count=utils.simplify_number(category_count),
-                    stars_count=utils.simplify_number(stars_count),
-                )
+                full_markdown += str(f.read()).format(**counts)
         else:
             log.warning(
                 "The markdown footer file does not exist: "
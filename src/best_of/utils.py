@@ -3,6 +3,7 @@ import re
 import sys
 import textwrap
 from datetime import datetime
+from functools import lru_cache
 
 
 def simplify_str(text: str) -> str:
@@ -17,6 +18,7 @@ def clean_whitespaces(text: str) -> str:
     return " ".join(text.split())
 
 
+@lru_cache(maxsize=4096)
 def simplify_number(num: int) -> str:
     num_converted = float("{:.2g}".format(num))
     magnitude = 0
@@ -0,0 +1,29 @@
+from addict import Dict
+
+from best_of.generators import markdown_list
+
+LABELS = [
+    {"label": "python", "name": "Python"},
+    {"label": "hidden", "name": "Hidden", "ignore": True},
+]
+
+
+def test_get_label_info():
+    assert markdown_list.get_label_info("Py-Thon", LABELS).name == "Python"
+    assert markdown_list.get_label_info("unknown", LABELS) == Dict({"name": "unknown"})
+
+
+def test_get_label_info_changed_labels():
+    labels = [{"label": "a", "name": "A"}]
+    assert markdown_list.get_label_info("a", labels).name == "A"
+
+    labels[0]["name"] = "A2"
+    labels.append({"label": "b", "name": "B"})
+    assert markdown_list.get_label_info("a", labels).name == "A2"
+    assert markdown_list.get_label_info("b", labels).name == "B"
+
+
+def test_generate_project_labels():
+    project = Dict({"labels": ["PYTHON", "hidden", "unknown"]})
+    labels_md, _ = markdown_list.generate_project_labels(project, LABELS)
+    assert labels_md == " · <code>Python</code> · <code>unknown</code>"
@@ -3,3 +3,9 @@ from best_of import utils
 
 def test_clean_whitespaces():
     assert utils.clean_whitespaces("test  foo") == "test foo"
+
+
+def test_simplify_number():
+    assert utils.simplify_number(999) == "1K"
+    assert utils.simplify_number(12345) == "12K"
+    assert utils.simplify_number(2500000) == "2.5M"